@@ -18,13 +18,15 @@ if not supabase_url or not supabase_key:
 
 supabase = create_client(supabase_url, supabase_key)
 
+IST = pytz.timezone('Asia/Kolkata')
+
 def main():
     print('🔍 CHECKING SCHEDULED POSTS STATUS...')
     print('=' * 50)
 
     # Get current time in IST
     utc_now = datetime.now(pytz.UTC)
-    ist_now = utc_now.astimezone(pytz.timezone('Asia/Kolkata'))
+    ist_now = utc_now.astimezone(IST)
     print(f'Current IST Time: {ist_now.strftime("%Y-%m-%d %H:%M:%S %Z")}')
     print()
 
@@ -49,8 +51,8 @@ def main():
             try:
                 if scheduled_utc.endswith('Z'):
                     scheduled_utc = scheduled_utc[:-1] + '+00:00'
-                utc_dt = datetime.fromisoformat(scheduled_utc.replace('Z', '+00:00'))
-                ist_dt = utc_dt.astimezone(pytz.timezone('Asia/Kolkata'))
+                utc_dt = datetime.fromisoformat(scheduled_utc)
+                ist_dt = utc_dt.astimezone(IST)
                 scheduled_ist = ist_dt.strftime('%H:%M:%S IST')
 
                 # Check if due
@@ -4,29 +4,181 @@ Handles publishing content to social media platforms for both created_content an
 """
 
 import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import os
+import unicodedata
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
 from cryptography.fernet import Fernet
 import httpx
-import pytz
 
 logger = logging.getLogger(__name__)
 
+GRAPH_API_URL = "https://graph.facebook.com/v18.0"
+LINKEDIN_UGC_POSTS_URL = "https://api.linkedin.com/v2/ugcPosts"
+
+INSTAGRAM_CAPTION_LIMIT = 2200
+
+# Per-request timeouts (seconds); applied per call so a shared client can serve all of them.
+# Waiting for a free pooled connection has its own budget, so a busy shared pool never
+# eats into the time a request gets once it is actually on the wire.
+POOL_TIMEOUT = 300.0
+REQUEST_TIMEOUT = httpx.Timeout(60.0, pool=POOL_TIMEOUT)
+VIDEO_REQUEST_TIMEOUT = httpx.Timeout(180.0, pool=POOL_TIMEOUT)
+URL_CHECK_TIMEOUT = httpx.Timeout(10.0, pool=POOL_TIMEOUT)
+
+# How long to wait for Instagram to finish processing uploaded media, and how often to poll
+VIDEO_PROCESSING_WAIT_SECONDS = 120
+IMAGE_PROCESSING_WAIT_SECONDS = 60
+PROCESSING_POLL_INTERVAL_SECONDS = 5
+
+# Characters that extend the preceding character into one visible glyph
+ZERO_WIDTH_JOINER = '\u200d'
+GRAPHEME_EXTEND_CATEGORIES = frozenset({'Mn', 'Mc', 'Me'})
+
+# Troubleshooting hints logged for Instagram API failures, keyed by HTTP status
+ERROR_HINTS = {
+    "instagram_publish": {
+        400: (
+            "400 Bad Request - Possible causes:",
+            "- Invalid creation_id or expired",
+            "- Insufficient token permissions",
+            "- Content violates Instagram policies",
+            "- Rate limiting or duplicate content",
+        ),
+        401: ("401 Unauthorized - Token may be invalid or expired",),
+        403: ("403 Forbidden - Token lacks publish permissions",),
+    },
+    "instagram_container": {
+        400: (
+            "400 Bad Request - Media container creation failed:",
+            "- Image/video URL may not be accessible by Instagram",
+            "- Image may be too large (>8MB) or wrong format",
+            "- Caption may be too long (>2200 characters)",
+            "- Access token may lack publish_to_instagram permission",
+            "- Instagram Business account may not be properly set up",
+            "- The image URL might be from a private/supabase storage that Instagram can't access",
+        ),
+        401: ("401 Unauthorized - Token may be invalid or expired",),
+        403: ("403 Forbidden - Token lacks Instagram publish permissions",),
+    },
+}
+
+# File extensions treated as video when no explicit media type is available
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.flv', '.3gp'})
+
+
+def is_video_url(url: str) -> bool:
+    """Check whether a media URL points to a video based on its file extension"""
+    path = url.split('?', 1)[0]
+    return os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS
+
+
+def _is_regional_indicator(char: str) -> bool:
+    """Check whether char is one half of a two-letter flag emoji"""
+    return '\U0001f1e6' <= char <= '\U0001f1ff'
+
+
+def _continues_grapheme(text: str, index: int) -> bool:
+    """Check whether the character at index belongs to the previous glyph"""
+    char = text[index]
+    if _is_regional_indicator(char):
+        # Regional indicators pair up into flags; an odd run before index means
+        # this character is the second half of a pair
+        run = 0
+        while index - run > 0 and _is_regional_indicator(text[index - run - 1]):
+            run += 1
+        return run % 2 == 1
+    return (
+        char == ZERO_WIDTH_JOINER
+        or text[index - 1] == ZERO_WIDTH_JOINER
+        or '\U0001f3fb' <= char <= '\U0001f3ff'  # emoji skin tone modifiers
+        or '\U000e0020' <= char <= '\U000e007f'  # emoji tag sequences (subdivision flags)
+        or unicodedata.category(char) in GRAPHEME_EXTEND_CATEGORIES
+    )
+
+
+def truncate_text(text: str, limit: int, suffix: str = "...") -> str:
+    """
+    Truncate text to at most limit characters, ending with suffix
+
+    The cut is moved back so combining marks, variation selectors, emoji
+    ZWJ sequences, flags and tag sequences are never split in half.
+
+    >>> truncate_text('ab' + '\U0001f1fa\U0001f1f8' * 3, 7)
+    'ab\U0001f1fa\U0001f1f8...'
+    >>> truncate_text('aaaa' + '\U0001f1fa\U0001f1f8' * 2 + 'b', 8)
+    'aaaa...'
+    >>> truncate_text('ab\U0001f3f4\U000e0067\U000e0062\U000e0065\U000e006e\U000e0067\U000e007f', 8)
+    'ab...'
+    """
+    if len(text) <= limit:
+        return text
+
+    cut = limit - len(suffix)
+    while cut > 0 and _continues_grapheme(text, cut):
+        cut -= 1
+    return text[:cut] + suffix
+
+
+def build_caption(post_data: Dict[str, Any]) -> str:
+    """Join title, message and hashtags into the text posted to a platform"""
+    parts = []
+    title = post_data.get("title", "")
+    if title:
+        parts.append(title)
+    parts.append(post_data.get("message", ""))
+    hashtags = post_data.get("hashtags", [])
+    if hashtags:
+        parts.append(" ".join([f"#{tag.replace('#', '')}" for tag in hashtags]))
+    return "\n\n".join(parts)
+
 class ContentPublisherService:
     """Service for publishing content to social media platforms"""
 
-    def __init__(self, supabase_client, cipher: Optional[Fernet] = None):
+    def __init__(self, supabase_client, cipher: Optional[Fernet] = None,
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.supabase = supabase_client
         self.cipher = cipher
+        # Optional client shared across publishes so connections are reused; owned by the caller
+        self.http_client = http_client
+        # encrypted token -> decrypted token; a user's posts share one connection token
+        self._decrypted_tokens = {}
+        # (hint kind, status code) pairs whose troubleshooting hints were already logged
+        self._logged_error_hints = set()
+        self._platform_publishers = {
+            "facebook": self._publish_to_facebook,
+            "instagram": self._publish_to_instagram,
+            "linkedin": self._publish_to_linkedin,
+            "youtube": self._publish_to_youtube,
+        }
+
+    @asynccontextmanager
+    async def _http_client(self):
+        """Yield the shared HTTP client, or a short-lived one when none was provided"""
+        if self.http_client is not None:
+            yield self.http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+
+    async def publish_created_content(self, content: Dict[str, Any], update_status: bool = True) -> bool:
+        """
+        Publish a single piece of created content
 
-    async def publish_created_content(self, content: Dict[str, Any]) -> bool:
-        """Publish a single piece of created content"""
+        Callers that write their own status and metadata afterwards pass
+        update_status=False to avoid a second write to the same row.
+        """
         content_id = content.get("id")
         platform = content.get("platform", "").lower()
-        channel = content.get("channel", "").lower()
         user_id = content.get("user_id")
 
+        # Unsupported platforms can never publish, so skip the connection lookup
+        if platform not in self._platform_publishers:
+            logger.warning("Platform %s not supported for auto-publishing", platform)
+            return False
+
         try:
             # Get user connection
             connection_response = self.supabase.table("platform_connections").select("*").eq(
@@ -34,7 +186,7 @@ class ContentPublisherService:
             ).eq("platform", platform).eq("is_active", True).execute()
 
             if not connection_response.data:
-                logger.warning(f"No active {platform} connection found for user {user_id}")
+                logger.warning("No active %s connection found for user %s", platform, user_id)
                 return False
 
             connection = connection_response.data[0]
@@ -46,31 +198,54 @@ class ContentPublisherService:
             success = await self.publish_to_platform(platform, post_data, connection)
 
             # Update status if successful
-            if success:
+            if success and update_status:
                 self.supabase.table("created_content").update({
                     "status": "published"
                 }).eq("id", content_id).execute()
-                logger.info(f"Status updated to published for {content_id}")
+                logger.info("Status updated to published for %s", content_id)
 
             return success
 
         except Exception as e:
-            logger.error(f"Error publishing created content {content_id}: {e}")
+            logger.error("Error publishing created content %s: %s", content_id, e)
             return False
 
     def decrypt_token(self, encrypted_token: str) -> str:
-        """Decrypt an encrypted token"""
+        """Decrypt an encrypted token, reusing earlier results for the same token"""
         if not self.cipher:
             return encrypted_token
 
+        token = self._decrypted_tokens.get(encrypted_token)
+        if token is not None:
+            return token
+
         try:
-            return self.cipher.decrypt(encrypted_token.encode()).decode()
+            token = self.cipher.decrypt(encrypted_token.encode()).decode()
         except Exception as e:
-            logger.warning(f"Failed to decrypt token, trying as plaintext: {e}")
+            logger.warning("Failed to decrypt token, trying as plaintext: %s", e)
             # If decryption fails, try using as plaintext (for backward compatibility)
-            if encrypted_token.startswith(('EAAB', 'EAA', 'AQA')):
-                return encrypted_token
-            raise
+            if not encrypted_token.startswith(('EAAB', 'EAA', 'AQA')):
+                raise
+            token = encrypted_token
+
+        self._decrypted_tokens[encrypted_token] = token
+        return token
+
+    def _log_error_hints(self, kind: str, status_code: int):
+        """
+        Log troubleshooting hints for an API error, once per kind and status code
+
+        The dedup lasts as long as this instance: one batch in the scheduler,
+        but the whole worker process for the enterprise queue's long-lived publisher.
+        """
+        hints = ERROR_HINTS[kind].get(status_code)
+        key = (kind, status_code)
+        if not hints or key in self._logged_error_hints:
+            return
+
+        self._logged_error_hints.add(key)
+        for hint in hints:
+            logger.warning(hint)
 
     def get_user_timezone(self, user_id: str) -> str:
         """Get user's timezone from profile or default to UTC"""
@@ -80,7 +255,7 @@ class ContentPublisherService:
                 return response.data[0]["timezone"]
             return "UTC"
         except Exception as e:
-            logger.warning(f"Error getting timezone for user {user_id}: {e}, defaulting to UTC")
+            logger.warning("Error getting timezone for user %s: %s, defaulting to UTC", user_id, e)
             return "UTC"
 
     def prepare_post_data(self, post: Dict[str, Any], table_type: str = "content_posts") -> Dict[str, Any]:
@@ -95,7 +270,10 @@ class ContentPublisherService:
             Dict with standardized post data for publishing
         """
         post_id = post.get("id")
-        platform = post.get("platform", "").lower()
+        metadata = post.get("metadata", {})
+        # content_posts rows store the media kind in post_type, created_content rows in content_type
+        type_field = "post_type" if table_type == "content_posts" else "content_type"
+        media_kind = (post.get(type_field) or "").lower()
 
         # Initialize post data
         post_data = {
@@ -111,25 +289,19 @@ class ContentPublisherService:
 
         if table_type == "created_content":
             # For created_content: check metadata.carousel_images first, then images[] array
-            metadata = post.get("metadata", {})
-            content_type = post.get("content_type", "").lower()
-
             if metadata.get("carousel_images"):
                 carousel_images = metadata["carousel_images"]
                 is_carousel = True
-            elif content_type == "carousel" and post.get("images"):
+            elif media_kind == "carousel" and post.get("images"):
                 carousel_images = post.get("images", [])
                 is_carousel = True
 
         elif table_type == "content_posts":
             # For content_posts: check metadata.carousel_images
-            metadata = post.get("metadata", {})
-            post_type = post.get("post_type", "").lower()
-
             if metadata.get("carousel_images"):
                 carousel_images = metadata["carousel_images"]
                 is_carousel = True
-            elif post_type == "carousel":
+            elif media_kind == "carousel":
                 # Fallback for older posts
                 is_carousel = True
 
@@ -153,24 +325,19 @@ class ContentPublisherService:
             # Check if media is a video
             is_video = False
             if image_url:
-                post_type = post.get("post_type", "") if table_type == "content_posts" else post.get("content_type", "")
-                metadata = post.get("metadata", {})
-
                 # Check post_type first
-                if post_type and post_type.lower() == 'video':
+                if media_kind == 'video':
                     is_video = True
-                    logger.info(f"Video detected from post_type for post {post_id}")
+                    logger.info("Video detected from post_type for post %s", post_id)
                 # Check metadata.media_type
                 elif metadata and metadata.get('media_type') == 'video':
                     is_video = True
-                    logger.info(f"Video detected from metadata.media_type for post {post_id}")
+                    logger.info("Video detected from metadata.media_type for post %s", post_id)
                 # Check file extension as fallback
                 else:
-                    video_extensions = ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.flv', '.3gp']
-                    url_lower = image_url.lower().split('?')[0]
-                    is_video = any(url_lower.endswith(ext) for ext in video_extensions)
+                    is_video = is_video_url(image_url)
                     if is_video:
-                        logger.info(f"Video detected from file extension for post {post_id}")
+                        logger.info("Video detected from file extension for post %s", post_id)
 
                 if is_video:
                     post_data["is_video"] = True
@@ -197,18 +364,13 @@ class ContentPublisherService:
         Returns:
             bool: Success status
         """
-        if platform == "facebook":
-            return await self._publish_to_facebook(connection, post_data)
-        elif platform == "instagram":
-            return await self._publish_to_instagram(connection, post_data)
-        elif platform == "linkedin":
-            return await self._publish_to_linkedin(connection, post_data)
-        elif platform == "youtube":
-            return await self._publish_to_youtube(connection, post_data)
-        else:
-            logger.warning(f"Platform {platform} not supported for auto-publishing")
+        publisher = self._platform_publishers.get(platform)
+        if publisher is None:
+            logger.warning("Platform %s not supported for auto-publishing", platform)
             return False
 
+        return await publisher(connection, post_data)
+
     async def _publish_to_facebook(self, connection: Dict[str, Any], post_data: Dict[str, Any]) -> bool:
         """Publish to Facebook"""
         try:
@@ -224,53 +386,44 @@ class ContentPublisherService:
                 return False
 
             # Prepare message
-            message = post_data.get("message", "")
-            title = post_data.get("title", "")
-            hashtags = post_data.get("hashtags", [])
-
-            full_message = ""
-            if title:
-                full_message += f"{title}\n\n"
-            full_message += message
-            if hashtags:
-                hashtag_string = " ".join([f"#{tag.replace('#', '')}" for tag in hashtags])
-                full_message += f"\n\n{hashtag_string}"
+            full_message = build_caption(post_data)
 
             image_url = post_data.get("image_url", "")
             carousel_images = post_data.get("carousel_images", [])
             is_carousel = post_data.get("post_type") == "carousel" or (carousel_images and len(carousel_images) > 0)
+            page_url = f"{GRAPH_API_URL}/{page_id}"
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with self._http_client() as client:
                 if is_carousel and carousel_images:
                     # Handle carousel post
-                    logger.info(f"Publishing Facebook carousel with {len(carousel_images)} images")
+                    logger.info("Publishing Facebook carousel with %s images", len(carousel_images))
 
                     # Step 1: Create photo containers for each image (published=false)
                     photo_ids = []
+                    photo_url = f"{page_url}/photos"
                     for idx, img_url in enumerate(carousel_images):
                         try:
-                            photo_url = f"https://graph.facebook.com/v18.0/{page_id}/photos"
                             photo_params = {
                                 "url": img_url,
                                 "published": "false",
                                 "access_token": access_token
                             }
 
-                            photo_response = await client.post(photo_url, params=photo_params)
+                            photo_response = await client.post(photo_url, params=photo_params, timeout=REQUEST_TIMEOUT)
                             if photo_response.status_code == 200:
                                 photo_data = photo_response.json()
                                 photo_id = photo_data.get('id')
                                 if photo_id:
                                     photo_ids.append({"media_fbid": photo_id})
-                                    logger.info(f"Created photo container {idx + 1}/{len(carousel_images)}: {photo_id}")
+                                    logger.info("Created photo container %s/%s: %s", idx + 1, len(carousel_images), photo_id)
                                 else:
-                                    logger.warning(f"Photo container {idx + 1} created but no ID returned")
+                                    logger.warning("Photo container %s created but no ID returned", idx + 1)
                             else:
                                 error_data = photo_response.json() if photo_response.headers.get('content-type', '').startswith('application/json') else {"error": photo_response.text}
-                                logger.error(f"Failed to create photo container {idx + 1}: {error_data}")
+                                logger.error("Failed to create photo container %s: %s", idx + 1, error_data)
                                 return False
                         except Exception as e:
-                            logger.error(f"Error creating photo container {idx + 1}: {e}")
+                            logger.error("Error creating photo container %s: %s", idx + 1, e)
                             return False
 
                     if not photo_ids:
@@ -278,42 +431,41 @@ class ContentPublisherService:
                         return False
 
                     # Step 2: Create carousel post with attached_media
-                    import json
-                    url = f"https://graph.facebook.com/v18.0/{page_id}/feed"
+                    url = f"{page_url}/feed"
                     params = {
                         "message": full_message,
                         "attached_media": json.dumps(photo_ids),
                         "access_token": access_token
                     }
 
-                    logger.info(f"Posting carousel to feed endpoint with {len(photo_ids)} photos")
-                    response = await client.post(url, params=params)
+                    logger.info("Posting carousel to feed endpoint with %s photos", len(photo_ids))
+                    response = await client.post(url, params=params, timeout=REQUEST_TIMEOUT)
 
                     # Parse response
                     try:
                         response_data = response.json()
                     except:
                         response_text = response.text
-                        logger.error(f"Facebook API returned non-JSON response: {response_text}")
+                        logger.error("Facebook API returned non-JSON response: %s", response_text)
                         return False
 
                     if response.status_code == 200:
                         if response_data.get("id"):
-                            logger.info(f"Facebook carousel post published: {response_data.get('id')}")
+                            logger.info("Facebook carousel post published: %s", response_data.get('id'))
                             return True
                         else:
-                            logger.error(f"Facebook carousel post failed - no ID in response: {response_data}")
+                            logger.error("Facebook carousel post failed - no ID in response: %s", response_data)
                             return False
                     else:
                         error_message = response_data.get("error", {}).get("message", "Unknown error") if isinstance(response_data, dict) else str(response_data)
-                        logger.error(f"Facebook carousel API error: {error_message}")
+                        logger.error("Facebook carousel API error: %s", error_message)
                         return False
 
                 # Handle single image/video post
                 if image_url:
                     if post_data.get("is_video"):
                         # For videos, use videos endpoint
-                        url = f"https://graph.facebook.com/v18.0/{page_id}/videos"
+                        url = f"{page_url}/videos"
                         params = {
                             "file_url": image_url,
                             "description": full_message,
@@ -321,7 +473,7 @@ class ContentPublisherService:
                         }
                     else:
                         # For images, use photos endpoint
-                        url = f"https://graph.facebook.com/v18.0/{page_id}/photos"
+                        url = f"{page_url}/photos"
                         params = {
                             "url": image_url,
                             "caption": full_message,
@@ -329,34 +481,34 @@ class ContentPublisherService:
                         }
                 else:
                     # For text-only posts, use feed endpoint
-                    url = f"https://graph.facebook.com/v18.0/{page_id}/feed"
+                    url = f"{page_url}/feed"
                     params = {
                         "message": full_message,
                         "access_token": access_token
                     }
 
-                response = await client.post(url, params=params)
+                response = await client.post(url, params=params, timeout=REQUEST_TIMEOUT)
 
                 # Parse response
                 try:
                     response_data = response.json()
                 except:
                     response_text = response.text
-                    logger.error(f"Facebook API returned non-JSON response: {response_text}")
+                    logger.error("Facebook API returned non-JSON response: %s", response_text)
                     return False
 
                 if response.status_code == 200:
                     if response_data.get("id"):
-                        logger.info(f"Facebook post published: {response_data.get('id')}")
+                        logger.info("Facebook post published: %s", response_data.get('id'))
                         return True
                     else:
-                        logger.error(f"Facebook post failed - no ID in response: {response_data}")
+                        logger.error("Facebook post failed - no ID in response: %s", response_data)
                         return False
                 else:
                     error_message = response_data.get("error", {}).get("message", "Unknown error") if isinstance(response_data, dict) else str(response_data)
                     error_code = response_data.get("error", {}).get("code", response.status_code) if isinstance(response_data, dict) else response.status_code
                     error_type = response_data.get("error", {}).get("type", "Unknown") if isinstance(response_data, dict) else "Unknown"
-                    logger.error(f"Facebook API error ({error_code}, {error_type}): {error_message}. Full response: {response_data}")
+                    logger.error("Facebook API error (%s, %s): %s. Full response: %s", error_code, error_type, error_message, response_data)
                     return False
 
         except httpx.HTTPStatusError as e:
@@ -366,10 +518,10 @@ class ContentPublisherService:
             except:
                 error_data = {"error": str(e)}
             error_msg = error_data.get("error", {}).get("message", str(e)) if isinstance(error_data, dict) else str(e)
-            logger.error(f"HTTP error publishing to Facebook: {error_msg}. Status: {e.response.status_code if e.response else 'unknown'}. Response: {error_data}")
+            logger.error("HTTP error publishing to Facebook: %s. Status: %s. Response: %s", error_msg, e.response.status_code if e.response else 'unknown', error_data)
             return False
         except Exception as e:
-            logger.error(f"Error publishing to Facebook: {type(e).__name__}: {str(e)}", exc_info=True)
+            logger.error("Error publishing to Facebook: %s: %s", type(e).__name__, e, exc_info=True)
             return False
 
     async def _publish_to_instagram(self, connection: Dict[str, Any], post_data: Dict[str, Any]) -> bool:
@@ -382,54 +534,46 @@ class ContentPublisherService:
                 logger.error("No page_id found in Instagram connection")
                 return False
 
+            page_url = f"{GRAPH_API_URL}/{page_id}"
+
             # Check if this is a carousel post
             carousel_images = post_data.get("carousel_images", [])
             is_carousel = post_data.get("post_type") == "carousel" or (carousel_images and len(carousel_images) > 0)
 
             if is_carousel and carousel_images:
                 # Handle carousel post
-                logger.info(f"Publishing Instagram carousel with {len(carousel_images)} images")
+                logger.info("Publishing Instagram carousel with %s images", len(carousel_images))
 
                 # Prepare caption
-                message = post_data.get("message", "")
-                title = post_data.get("title", "")
-                hashtags = post_data.get("hashtags", [])
-
-                caption = ""
-                if title:
-                    caption += f"{title}\n\n"
-                caption += message
-                if hashtags:
-                    hashtag_string = " ".join([f"#{tag.replace('#', '')}" for tag in hashtags])
-                    caption += f"\n\n{hashtag_string}"
-
-                async with httpx.AsyncClient(timeout=60.0) as client:
+                caption = build_caption(post_data)
+
+                async with self._http_client() as client:
                     # Step 1: Create media containers for each image (is_carousel_item=true)
                     container_ids = []
+                    container_url = f"{page_url}/media"
                     for idx, img_url in enumerate(carousel_images):
                         try:
-                            container_url = f"https://graph.facebook.com/v18.0/{page_id}/media"
                             container_params = {
                                 "image_url": img_url,
                                 "is_carousel_item": "true",
                                 "access_token": access_token
                             }
 
-                            container_response = await client.post(container_url, params=container_params)
+                            container_response = await client.post(container_url, params=container_params, timeout=REQUEST_TIMEOUT)
                             if container_response.status_code == 200:
                                 container_result = container_response.json()
                                 container_id = container_result.get('id')
                                 if container_id:
                                     container_ids.append(container_id)
-                                    logger.info(f"Created media container {idx + 1}/{len(carousel_images)}: {container_id}")
+                                    logger.info("Created media container %s/%s: %s", idx + 1, len(carousel_images), container_id)
                                 else:
-                                    logger.warning(f"Media container {idx + 1} created but no ID returned")
+                                    logger.warning("Media container %s created but no ID returned", idx + 1)
                             else:
                                 error_data = container_response.json() if container_response.headers.get('content-type', '').startswith('application/json') else {"error": container_response.text}
-                                logger.error(f"Failed to create media container {idx + 1}: {error_data}")
+                                logger.error("Failed to create media container %s: %s", idx + 1, error_data)
                                 return False
                         except Exception as e:
-                            logger.error(f"Error creating media container {idx + 1}: {e}")
+                            logger.error("Error creating media container %s: %s", idx + 1, e)
                             return False
 
                     if not container_ids:
@@ -437,7 +581,7 @@ class ContentPublisherService:
                         return False
 
                     # Step 2: Create carousel container with children parameter
-                    carousel_url = f"https://graph.facebook.com/v18.0/{page_id}/media"
+                    carousel_url = f"{page_url}/media"
                     carousel_params = {
                         "media_type": "CAROUSEL",
                         "children": ",".join(container_ids),
@@ -445,12 +589,12 @@ class ContentPublisherService:
                         "access_token": access_token
                     }
 
-                    logger.info(f"Creating Instagram carousel container with {len(container_ids)} children")
-                    carousel_response = await client.post(carousel_url, params=carousel_params)
+                    logger.info("Creating Instagram carousel container with %s children", len(container_ids))
+                    carousel_response = await client.post(carousel_url, params=carousel_params, timeout=REQUEST_TIMEOUT)
 
                     if carousel_response.status_code != 200:
                         error_data = carousel_response.json() if carousel_response.headers.get('content-type', '').startswith('application/json') else {"error": carousel_response.text}
-                        logger.error(f"Failed to create carousel container: {error_data}")
+                        logger.error("Failed to create carousel container: %s", error_data)
                         return False
 
                     carousel_result = carousel_response.json()
@@ -461,36 +605,27 @@ class ContentPublisherService:
                         return False
 
                     # Step 3: Publish the carousel
-                    publish_url = f"https://graph.facebook.com/v18.0/{page_id}/media_publish"
+                    publish_url = f"{page_url}/media_publish"
                     publish_params = {
                         "creation_id": creation_id,
                         "access_token": access_token
                     }
 
-                    logger.info(f"Publishing Instagram carousel: {creation_id}")
-                    publish_response = await client.post(publish_url, params=publish_params)
+                    logger.info("Publishing Instagram carousel: %s", creation_id)
+                    publish_response = await client.post(publish_url, params=publish_params, timeout=REQUEST_TIMEOUT)
 
                     if publish_response.status_code == 200:
                         publish_result = publish_response.json()
                         post_id = publish_result.get('id')
-                        logger.info(f"Instagram carousel post published: {post_id}")
+                        logger.info("Instagram carousel post published: %s", post_id)
                         return True
                     else:
                         # Handle HTTP errors gracefully for carousel
                         error_data = publish_response.json() if publish_response.headers.get('content-type', '').startswith('application/json') else {"error": publish_response.text}
-                        logger.error(f"Error publishing Instagram carousel: {error_data}")
+                        logger.error("Error publishing Instagram carousel: %s", error_data)
 
                         # Log specific error details for debugging
-                        if publish_response.status_code == 400:
-                            logger.warning("400 Bad Request - Possible causes:")
-                            logger.warning("- Invalid creation_id or expired")
-                            logger.warning("- Insufficient token permissions")
-                            logger.warning("- Content violates Instagram policies")
-                            logger.warning("- Rate limiting or duplicate content")
-                        elif publish_response.status_code == 401:
-                            logger.warning("401 Unauthorized - Token may be invalid or expired")
-                        elif publish_response.status_code == 403:
-                            logger.warning("403 Forbidden - Token lacks publish permissions")
+                        self._log_error_hints("instagram_publish", publish_response.status_code)
 
                         return False
 
@@ -507,49 +642,39 @@ class ContentPublisherService:
             is_video = post_data.get("is_video", False)
             if not is_video and media_url:
                 # Fallback: Check if URL is a video by file extension
-                video_extensions = ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.flv', '.3gp']
-                media_url_lower = media_url.lower()
-                url_without_query = media_url_lower.split('?')[0]
-                is_video = any(url_without_query.endswith(ext) for ext in video_extensions)
+                is_video = is_video_url(media_url)
+
+            # Label used by the progress logs below, decided once per publish
+            media_label = 'Video' if is_video else 'Image'
 
             if is_video:
-                logger.info(f"Media type detection: Video/Reel - URL: {media_url[:100] if media_url else 'N/A'}...")
+                logger.info("Media type detection: Video/Reel - URL: %s...", media_url[:100] if media_url else 'N/A')
             else:
-                logger.info(f"Media type detection: Image - URL: {media_url[:100] if media_url else 'N/A'}...")
+                logger.info("Media type detection: Image - URL: %s...", media_url[:100] if media_url else 'N/A')
 
             # Prepare caption
-            message = post_data.get("message", "")
-            title = post_data.get("title", "")
-            hashtags = post_data.get("hashtags", [])
-
-            caption = ""
-            if title:
-                caption += f"{title}\n\n"
-            caption += message
-            if hashtags:
-                hashtag_string = " ".join([f"#{tag.replace('#', '')}" for tag in hashtags])
-                caption += f"\n\n{hashtag_string}"
+            caption = build_caption(post_data)
 
             # Validate caption length (Instagram limit is 2200 characters)
-            if len(caption) > 2200:
-                logger.warning(f"Caption too long ({len(caption)} chars), truncating to 2200...")
-                caption = caption[:2197] + "..."
+            if len(caption) > INSTAGRAM_CAPTION_LIMIT:
+                logger.warning("Caption too long (%s chars), truncating to %s...", len(caption), INSTAGRAM_CAPTION_LIMIT)
+                caption = truncate_text(caption, INSTAGRAM_CAPTION_LIMIT)
 
             # Validate image URL accessibility (basic check)
             if not is_video and media_url:
                 # Check if URL is accessible
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as check_client:
-                        head_response = await check_client.head(media_url)
+                    async with self._http_client() as check_client:
+                        head_response = await check_client.head(media_url, timeout=URL_CHECK_TIMEOUT)
                         if head_response.status_code != 200:
-                            logger.warning(f"Image URL returned {head_response.status_code}: {media_url[:100]}...")
+                            logger.warning("Image URL returned %s: %s...", head_response.status_code, media_url[:100])
                             logger.warning("Instagram may not be able to access this image")
                 except Exception as e:
-                    logger.warning(f"Could not verify image URL accessibility: {e}")
+                    logger.warning("Could not verify image URL accessibility: %s", e)
                     logger.warning("Instagram may not be able to access this image")
 
             # Step 1: Create media container
-            container_url = f"https://graph.facebook.com/v18.0/{page_id}/media"
+            container_url = f"{page_url}/media"
 
             # Prepare container params based on media type
             if is_video:
@@ -560,11 +685,11 @@ class ContentPublisherService:
                     "caption": caption,
                     "access_token": access_token
                 }
-                logger.info(f"Creating Instagram reel with video URL")
+                logger.info("Creating Instagram reel with video URL")
                 files = None
             else:
                 # For images - USE URL APPROACH (Instagram requires public URLs)
-                logger.info(f"Using URL approach for Instagram image: {media_url[:100]}...")
+                logger.info("Using URL approach for Instagram image: %s...", media_url[:100])
                 files = None
                 container_params = {
                     "image_url": media_url,
@@ -573,22 +698,22 @@ class ContentPublisherService:
                 }
 
             # Use longer timeout for videos/reels
-            timeout = 180.0 if is_video else 60.0
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            timeout = VIDEO_REQUEST_TIMEOUT if is_video else REQUEST_TIMEOUT
+            async with self._http_client() as client:
                 # Create container
-                logger.info(f"Creating Instagram media container for {'video' if is_video else 'image'}...")
-                logger.info(f"Using URL approach: {media_url[:100]}...")
-                logger.info(f"Caption length: {len(caption)} characters")
+                logger.info("Creating Instagram media container for %s...", media_label.lower())
+                logger.info("Using URL approach: %s...", media_url[:100])
+                logger.info("Caption length: %s characters", len(caption))
 
                 try:
                     # All Instagram uploads now use URL approach with params
-                    container_response = await client.post(container_url, params=container_params)
+                    container_response = await client.post(container_url, params=container_params, timeout=timeout)
                     container_response.raise_for_status()
                     container_result = container_response.json()
                     creation_id = container_result.get("id")
 
                     if not creation_id:
-                        logger.error(f"Failed to create Instagram media container: {container_result}")
+                        logger.error("Failed to create Instagram media container: %s", container_result)
                         return False
 
                 except httpx.HTTPStatusError as e:
@@ -599,101 +724,87 @@ class ContentPublisherService:
                     except:
                         error_data = {"error": str(e)}
 
-                    logger.error(f"Instagram media container creation failed: {error_data}")
+                    logger.error("Instagram media container creation failed: %s", error_data)
 
                     # Log specific error details for debugging
-                    if e.response.status_code == 400:
-                        logger.warning("400 Bad Request - Media container creation failed:")
-                        logger.warning("- Image/video URL may not be accessible by Instagram")
-                        logger.warning("- Image may be too large (>8MB) or wrong format")
-                        logger.warning("- Caption may be too long (>2200 characters)")
-                        logger.warning("- Access token may lack publish_to_instagram permission")
-                        logger.warning("- Instagram Business account may not be properly set up")
-                        logger.warning("- The image URL might be from a private/supabase storage that Instagram can't access")
-                    elif e.response.status_code == 401:
-                        logger.warning("401 Unauthorized - Token may be invalid or expired")
-                    elif e.response.status_code == 403:
-                        logger.warning("403 Forbidden - Token lacks Instagram publish permissions")
+                    self._log_error_hints("instagram_container", e.response.status_code)
 
                     return False
 
                 # Wait for media processing before publishing (both images and videos)
-                status_url = f"https://graph.facebook.com/v18.0/{creation_id}"
-                max_wait_time = 120 if is_video else 60  # Videos get 2 minutes, images get 1 minute
-                wait_interval = 5  # Check every 5 seconds
+                status_url = f"{GRAPH_API_URL}/{creation_id}"
+                max_wait_time = VIDEO_PROCESSING_WAIT_SECONDS if is_video else IMAGE_PROCESSING_WAIT_SECONDS
+                wait_interval = PROCESSING_POLL_INTERVAL_SECONDS
                 elapsed_time = 0
+                logged_in_progress = False
 
-                logger.info(f"Waiting for {'video' if is_video else 'image'} processing (max {max_wait_time}s)...")
+                logger.info("Waiting for %s processing (max %ss)...", media_label.lower(), max_wait_time)
 
                 while elapsed_time < max_wait_time:
                     await asyncio.sleep(wait_interval)
                     elapsed_time += wait_interval
 
                     try:
-                        status_response = await client.get(status_url, params={"access_token": access_token, "fields": "status_code"})
+                        status_response = await client.get(status_url, params={"access_token": access_token, "fields": "status_code"}, timeout=timeout)
                         if status_response.status_code == 200:
                             status_data = status_response.json()
                             status_code = status_data.get("status_code")
 
                             # Status codes: "FINISHED" = ready, "IN_PROGRESS" = still processing, "ERROR" = failed
                             if status_code == "FINISHED":
-                                logger.info(f"{'Video' if is_video else 'Image'} processing finished, ready to publish")
+                                logger.info("%s processing finished, ready to publish", media_label)
                                 break
                             elif status_code == "ERROR":
-                                logger.error(f"{'Video' if is_video else 'Image'} processing failed with error status")
+                                logger.error("%s processing failed with error status", media_label)
                                 return False
                             elif status_code == "IN_PROGRESS":
-                                logger.info(f"Still processing... ({elapsed_time}s elapsed)")
+                                # Announce the wait once; later polls only log at debug level
+                                if not logged_in_progress:
+                                    logger.info("Still processing... (%ss elapsed)", elapsed_time)
+                                    logged_in_progress = True
+                                else:
+                                    logger.debug("Still processing... (%ss elapsed)", elapsed_time)
                             # If IN_PROGRESS, continue waiting
                         else:
-                            logger.warning(f"Could not check media status, proceeding anyway (HTTP {status_response.status_code})")
+                            logger.warning("Could not check media status, proceeding anyway (HTTP %s)", status_response.status_code)
                             break
                     except Exception as status_error:
-                        logger.warning(f"Error checking media status: {status_error}, proceeding anyway")
+                        logger.warning("Error checking media status: %s, proceeding anyway", status_error)
                         break
 
                 if elapsed_time >= max_wait_time:
-                    logger.warning(f"Media processing timeout after {max_wait_time}s, proceeding with publish attempt")
+                    logger.warning("Media processing timeout after %ss, proceeding with publish attempt", max_wait_time)
 
                 # Step 2: Publish the container
-                publish_url = f"https://graph.facebook.com/v18.0/{page_id}/media_publish"
+                publish_url = f"{page_url}/media_publish"
                 publish_params = {
                     "creation_id": creation_id,
                     "access_token": access_token
                 }
 
-                publish_response = await client.post(publish_url, params=publish_params)
+                publish_response = await client.post(publish_url, params=publish_params, timeout=timeout)
 
                 if publish_response.status_code == 200:
                     publish_result = publish_response.json()
                     if publish_result.get("id"):
                         post_id = publish_result.get("id")
-                        logger.info(f"Instagram {'reel' if is_video else 'post'} published: {post_id}")
+                        logger.info("Instagram %s published: %s", 'reel' if is_video else 'post', post_id)
                         return True
                     else:
-                        logger.error(f"Instagram post failed: {publish_result}")
+                        logger.error("Instagram post failed: %s", publish_result)
                         return False
                 else:
                     # Handle HTTP errors gracefully
                     error_data = publish_response.json() if publish_response.headers.get('content-type', '').startswith('application/json') else {"error": publish_response.text}
-                    logger.error(f"Error publishing to Instagram: {error_data}")
+                    logger.error("Error publishing to Instagram: %s", error_data)
 
                     # Log specific error details for debugging
-                    if publish_response.status_code == 400:
-                        logger.warning("400 Bad Request - Possible causes:")
-                        logger.warning("- Invalid creation_id or expired")
-                        logger.warning("- Insufficient token permissions")
-                        logger.warning("- Content violates Instagram policies")
-                        logger.warning("- Rate limiting or duplicate content")
-                    elif publish_response.status_code == 401:
-                        logger.warning("401 Unauthorized - Token may be invalid or expired")
-                    elif publish_response.status_code == 403:
-                        logger.warning("403 Forbidden - Token lacks publish permissions")
+                    self._log_error_hints("instagram_publish", publish_response.status_code)
 
                     return False
 
         except Exception as e:
-            logger.error(f"Error publishing to Instagram: {e}")
+            logger.error("Error publishing to Instagram: %s", e)
             return False
 
     async def _publish_to_linkedin(self, connection: Dict[str, Any], post_data: Dict[str, Any]) -> bool:
@@ -707,20 +818,10 @@ class ContentPublisherService:
                 return False
 
             # Prepare message
-            message = post_data.get("message", "")
-            title = post_data.get("title", "")
-            hashtags = post_data.get("hashtags", [])
-
-            full_message = ""
-            if title:
-                full_message += f"{title}\n\n"
-            full_message += message
-            if hashtags:
-                hashtag_string = " ".join([f"#{tag.replace('#', '')}" for tag in hashtags])
-                full_message += f"\n\n{hashtag_string}"
+            full_message = build_caption(post_data)
 
             # Post to LinkedIn using UGC API
-            url = "https://api.linkedin.com/v2/ugcPosts"
+            url = LINKEDIN_UGC_POSTS_URL
             headers = {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json",
@@ -757,20 +858,20 @@ class ContentPublisherService:
                 # For now, we'll skip image support in auto-publish
                 pass
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=payload)
+            async with self._http_client() as client:
+                response = await client.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 result = response.json()
 
                 if result.get("id"):
-                    logger.info(f"LinkedIn post published: {result.get('id')}")
+                    logger.info("LinkedIn post published: %s", result.get('id'))
                     return True
                 else:
-                    logger.error(f"LinkedIn post failed: {result}")
+                    logger.error("LinkedIn post failed: %s", result)
                     return False
 
         except Exception as e:
-            logger.error(f"Error publishing to LinkedIn: {e}")
+            logger.error("Error publishing to LinkedIn: %s", e)
             return False
 
     async def _publish_to_youtube(self, connection: Dict[str, Any], post_data: Dict[str, Any]) -> bool:
@@ -781,5 +882,5 @@ class ContentPublisherService:
             logger.warning("YouTube auto-publishing not yet implemented")
             return False
         except Exception as e:
-            logger.error(f"Error publishing to YouTube: {e}")
+            logger.error("Error publishing to YouTube: %s", e)
             return False
@@ -7,23 +7,65 @@ Handles thousands of posts with distributed workers, rate limiting, and monitori
 import asyncio
 import json
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any
 import aio_pika
 import redis.asyncio as redis
 from supabase import create_client
 import logging
 
+try:
+    # Optional C serializer for queue message bodies
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def encode_message(data: Dict[str, Any]) -> bytes:
+    """Serialize a queue message body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def decode_message(body: bytes) -> Dict[str, Any]:
+    """Deserialize a queue message body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body.decode())
+
 class EnterprisePublishingQueue:
     """
     Enterprise-grade queue system for social media publishing
     Similar to Zapier, Buffer, and other automation platforms
     """
 
+    # Queue names
+    queues = {
+        'high_priority': 'social_posts_high',
+        'normal_priority': 'social_posts_normal',
+        'low_priority': 'social_posts_low',
+        'retry_queue': 'social_posts_retry'
+    }
+
+    # Worker pools
+    worker_pools = {
+        'facebook': 10,    # 10 concurrent Facebook workers
+        'instagram': 8,    # 8 concurrent Instagram workers
+        'linkedin': 5,     # 5 concurrent LinkedIn workers
+        'youtube': 5       # 5 concurrent YouTube workers
+    }
+
+    # Rate limiting (requests per minute per platform)
+    rate_limits = {
+        'facebook': 50,    # 50/minute (well under 200/hour limit)
+        'instagram': 30,   # 30/minute (well under 100/hour limit)
+        'linkedin': 10,    # 10/minute (well under 20/day limit)
+        'youtube': 15      # 15/minute
+    }
+
     def __init__(self):
         # Redis for fast queue operations
         self.redis = redis.Redis(
@@ -42,29 +84,11 @@ class EnterprisePublishingQueue:
             os.getenv("SUPABASE_SERVICE_ROLE_KEY")
         )
 
-        # Queue names
-        self.queues = {
-            'high_priority': 'social_posts_high',
-            'normal_priority': 'social_posts_normal',
-            'low_priority': 'social_posts_low',
-            'retry_queue': 'social_posts_retry'
-        }
-
-        # Worker pools
-        self.worker_pools = {
-            'facebook': 10,    # 10 concurrent Facebook workers
-            'instagram': 8,    # 8 concurrent Instagram workers
-            'linkedin': 5,     # 5 concurrent LinkedIn workers
-            'youtube': 5       # 5 concurrent YouTube workers
-        }
-
-        # Rate limiting (requests per minute per platform)
-        self.rate_limits = {
-            'facebook': 50,    # 50/minute (well under 200/hour limit)
-            'instagram': 30,   # 30/minute (well under 100/hour limit)
-            'linkedin': 10,    # 10/minute (well under 20/day limit)
-            'youtube': 15      # 15/minute
-        }
+        # Publisher is created on first use and reused for every message. Its
+        # troubleshooting hints for a given API error are therefore logged once
+        # per worker process, not once per batch; the error line itself is
+        # still logged for every failure.
+        self._publisher = None
 
     async def initialize_queues(self):
         """Initialize RabbitMQ queues"""
@@ -94,37 +118,44 @@ class EnterprisePublishingQueue:
         connection = await aio_pika.connect_robust(self.rabbitmq_url)
         channel = await connection.channel()
 
-        enqueued_count = 0
-        for post in posts:
-            # Add metadata
-            post_data = {
-                'post': post,
-                'enqueued_at': datetime.utcnow().isoformat(),
-                'priority': priority,
-                'attempts': 0,
-                'max_attempts': 3
-            }
-
-            # Publish to queue
-            await channel.default_exchange.publish(
-                aio_pika.Message(
-                    body=json.dumps(post_data).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-                ),
-                routing_key=queue_name
-            )
-
-            enqueued_count += 1
-
-            # Update post status in database
-            await self.update_post_status(post['id'], 'queued', {
-                'queue_name': queue_name,
-                'priority': priority,
-                'enqueued_at': post_data['enqueued_at']
-            })
+        enqueued_at = datetime.utcnow().isoformat()
+        enqueued_ids = []
+        try:
+            for post in posts:
+                # Add metadata
+                post_data = {
+                    'post': post,
+                    'enqueued_at': enqueued_at,
+                    'priority': priority,
+                    'attempts': 0,
+                    'max_attempts': 3
+                }
 
-        await connection.close()
-        logger.info(f"✅ Enqueued {enqueued_count} posts to {queue_name}")
+                # Publish to queue
+                await channel.default_exchange.publish(
+                    aio_pika.Message(
+                        body=encode_message(post_data),
+                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+                    ),
+                    routing_key=queue_name
+                )
+
+                enqueued_ids.append(post['id'])
+        finally:
+            # Mark every post that reached the queue, even if a later publish failed,
+            # so the scheduler does not pick them up again. One database round trip;
+            # update_posts_status logs its own errors, so the connection still closes.
+            if enqueued_ids:
+                await self.update_posts_status(enqueued_ids, 'queued', {
+                    'queue_name': queue_name,
+                    'priority': priority,
+                    'enqueued_at': enqueued_at
+                })
+
+            await connection.close()
+
+        enqueued_count = len(enqueued_ids)
+        logger.info("✅ Enqueued %s posts to %s", enqueued_count, queue_name)
         return enqueued_count
 
     async def start_workers(self):
@@ -141,7 +172,7 @@ class EnterprisePublishingQueue:
 
     async def start_platform_workers(self, platform: str, worker_count: int):
         """Start workers for a specific platform"""
-        logger.info(f"👷 Starting {worker_count} workers for {platform}")
+        logger.info("👷 Starting %s workers for %s", worker_count, platform)
 
         # Create worker pool
         semaphore = asyncio.Semaphore(worker_count)
@@ -178,7 +209,7 @@ class EnterprisePublishingQueue:
         async with message.process():
             try:
                 # Parse message
-                post_data = json.loads(message.body.decode())
+                post_data = decode_message(message.body)
                 post = post_data['post']
                 attempts = post_data.get('attempts', 0)
 
@@ -203,50 +234,50 @@ class EnterprisePublishingQueue:
                         'attempts': attempts + 1,
                         'worker_processed': True
                     })
-                    logger.info(f"✅ Published post {post['id']} on {post['platform']}")
+                    logger.info("✅ Published post %s on %s", post['id'], post['platform'])
                 else:
                     # Handle failure
                     await self.handle_publish_failure(message, post_data)
 
             except Exception as e:
-                logger.error(f"❌ Error processing message: {e}")
+                logger.error("❌ Error processing message: %s", e)
                 await self.handle_processing_error(message, post_data)
 
     async def check_rate_limit(self, platform: str) -> bool:
         """Check if we're within rate limits using Redis"""
         key = f"rate_limit:{platform}:{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-
-        # Get current count
-        current_count = await self.redis.get(key)
-        current_count = int(current_count) if current_count else 0
-
-        # Check limit
         limit = self.rate_limits.get(platform, 10)
 
-        if current_count >= limit:
-            logger.warning(f"🚫 Rate limit exceeded for {platform}: {current_count}/{limit}")
+        # Increment counter and set expiry in a single round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, 60)  # Expire in 1 minute
+            current_count, _ = await pipe.execute()
+
+        # Check limit (the counter already includes this request)
+        if current_count > limit:
+            # Give back the slot so the counter keeps counting admitted messages only
+            await self.redis.decr(key)
+            logger.warning("🚫 Rate limit exceeded for %s: %s/%s", platform, limit, limit)
             return False
 
-        # Increment counter
-        await self.redis.incr(key)
-        await self.redis.expire(key, 60)  # Expire in 1 minute
-
         return True
 
     async def publish_single_post(self, post: Dict) -> bool:
         """Publish a single post (simplified version)"""
         try:
-            # Import your existing publisher
-            from content_publisher import ContentPublisherService
+            if self._publisher is None:
+                # Import your existing publisher
+                from content_publisher import ContentPublisherService
 
-            # Initialize publisher (you'd pass proper credentials)
-            publisher = ContentPublisherService(self.supabase, None)  # cipher would be passed
+                # Initialize publisher (you'd pass proper credentials)
+                self._publisher = ContentPublisherService(self.supabase, None)  # cipher would be passed
 
-            success = await publisher.publish_created_content(post)
+            success = await self._publisher.publish_created_content(post, update_status=False)
             return success
 
         except Exception as e:
-            logger.error(f"❌ Failed to publish post {post.get('id')}: {e}")
+            logger.error("❌ Failed to publish post %s: %s", post.get('id'), e)
             return False
 
     async def requeue_message(self, message, post_data, delay_seconds: int = 0):
@@ -272,15 +303,19 @@ class EnterprisePublishingQueue:
 
     async def update_post_status(self, post_id: str, status: str, metadata: Dict = None):
         """Update post status in database"""
+        await self.update_posts_status([post_id], status, metadata)
+
+    async def update_posts_status(self, post_ids: List[str], status: str, metadata: Dict = None):
+        """Update the status of several posts in a single database call"""
         try:
             update_data = {"status": status}
             if metadata:
                 update_data["god_mode_metadata"] = metadata
 
-            self.supabase.table("created_content").update(update_data).eq("id", post_id).execute()
+            self.supabase.table("created_content").update(update_data).in_("id", post_ids).execute()
 
         except Exception as e:
-            logger.error(f"Failed to update post {post_id} status: {e}")
+            logger.error("Failed to update status for posts %s: %s", post_ids, e)
 
     async def get_queue_stats(self):
         """Get comprehensive queue statistics"""
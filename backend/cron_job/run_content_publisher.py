@@ -4,12 +4,10 @@ Cron job script to publish scheduled content posts
 This script can be called directly or via cron to publish scheduled posts from created_content table
 """
 
+import asyncio
 import os
 import sys
-import argparse
 import logging
-from datetime import datetime
-import pytz
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,6 +27,34 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+async def publish_all_tables(publisher, test_user_id=None):
+    """Publish from created_content and content_posts, optionally only for the test user"""
+    published_created_content = 0
+    published_content_posts = 0
+    suffix = " for test user" if test_user_id else ""
+
+    try:
+        # Publish from created_content table
+        if test_user_id:
+            published_created_content = await publisher.check_and_publish_created_content_test_user(test_user_id)
+        else:
+            published_created_content = await publisher.check_and_publish_created_content()
+        logger.info("Published %s posts from created_content table%s", published_created_content, suffix)
+    except Exception as e:
+        logger.error("Error publishing from created_content table: %s", e)
+
+    try:
+        # Publish from content_posts table (existing logic)
+        if test_user_id:
+            published_content_posts = await publisher.check_and_publish_scheduled_posts_test_user(test_user_id)
+        else:
+            published_content_posts = await publisher.check_and_publish_scheduled_posts()
+        logger.info("Published %s posts from content_posts table%s", published_content_posts, suffix)
+    except Exception as e:
+        logger.error("Error publishing from content_posts table: %s", e)
+
+    return published_created_content, published_content_posts
+
 def main():
     """Run content publisher once"""
     try:
@@ -45,57 +71,23 @@ def main():
         # Create publisher instance
         publisher = PostPublisher(supabase_url, supabase_key)
 
-        # Import asyncio to run the async methods
-        import asyncio
-
         # For testing: Get test user ID from environment or use default
         test_user_id = os.getenv("TEST_USER_ID")
         test_user_email = os.getenv("TEST_USER_EMAIL", "services@atsnai.com")
 
         if test_user_id:
-            logger.info(f"TEST MODE: Only processing posts for user ID {test_user_id} ({test_user_email})")
-
-            # Run publishing for both tables but only for test user
-            published_created_content = 0
-            published_content_posts = 0
-
-            try:
-                # Publish from created_content table (filtered by test user)
-                published_created_content = asyncio.run(publisher.check_and_publish_created_content_test_user(test_user_id))
-                logger.info(f"Published {published_created_content} posts from created_content table for test user")
-            except Exception as e:
-                logger.error(f"Error publishing from created_content table: {e}")
-
-            try:
-                # Publish from content_posts table (filtered by test user)
-                published_content_posts = asyncio.run(publisher.check_and_publish_scheduled_posts_test_user(test_user_id))
-                logger.info(f"Published {published_content_posts} posts from content_posts table for test user")
-            except Exception as e:
-                logger.error(f"Error publishing from content_posts table: {e}")
+            logger.info("TEST MODE: Only processing posts for user ID %s (%s)", test_user_id, test_user_email)
         else:
             # Production mode: process all users (use original methods)
             logger.info("PRODUCTION MODE: Processing posts for all users")
 
-            # Run publishing for both tables
-            published_created_content = 0
-            published_content_posts = 0
-
-            try:
-                # Publish from created_content table
-                published_created_content = asyncio.run(publisher.check_and_publish_created_content())
-                logger.info(f"Published {published_created_content} posts from created_content table")
-            except Exception as e:
-                logger.error(f"Error publishing from created_content table: {e}")
-
-            try:
-                # Publish from content_posts table (existing logic)
-                published_content_posts = asyncio.run(publisher.check_and_publish_scheduled_posts())
-                logger.info(f"Published {published_content_posts} posts from content_posts table")
-            except Exception as e:
-                logger.error(f"Error publishing from content_posts table: {e}")
+        # Run publishing for both tables inside a single event loop
+        published_created_content, published_content_posts = asyncio.run(
+            publish_all_tables(publisher, test_user_id)
+        )
 
         total_published = published_created_content + published_content_posts
-        logger.info(f"Content publisher completed for test user. Total published: {total_published} posts")
+        logger.info("Content publisher completed for test user. Total published: %s posts", total_published)
         return 0
 
     except Exception as e:
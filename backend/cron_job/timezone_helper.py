@@ -6,6 +6,7 @@ Use this when scheduling content to ensure proper UTC storage
 
 import os
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 from supabase import create_client
 import pytz
@@ -16,10 +17,18 @@ class TimezoneHelper:
     """Helper class for timezone conversions"""
 
     def __init__(self):
-        self.supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-        )
+        # Created on first query so pure time conversions never open a connection
+        self._supabase = None
+
+    @property
+    def supabase(self):
+        """Supabase client, created on first use"""
+        if self._supabase is None:
+            self._supabase = create_client(
+                os.getenv('SUPABASE_URL'),
+                os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+            )
+        return self._supabase
 
     def get_user_timezone(self, user_id: str) -> str:
         """Get user's timezone, default to UTC"""
@@ -94,6 +103,11 @@ class TimezoneHelper:
             print(f"Error converting time: {e}")
             return utc_datetime
 
+@lru_cache(maxsize=1)
+def get_timezone_helper() -> TimezoneHelper:
+    """Shared TimezoneHelper so callers reuse one Supabase client"""
+    return TimezoneHelper()
+
 # Example usage functions
 def schedule_content_for_user(user_id: str, local_datetime: datetime, content_data: dict):
     """
@@ -101,7 +115,7 @@ def schedule_content_for_user(user_id: str, local_datetime: datetime, content_da
 
     This converts local time to UTC before storing in database
     """
-    helper = TimezoneHelper()
+    helper = get_timezone_helper()
 
     # Get user's timezone
     user_timezone = helper.get_user_timezone(user_id)
@@ -125,7 +139,7 @@ def display_scheduled_time(user_id: str, utc_timestamp: str):
     """
     Example: How to display scheduled time in user's local timezone
     """
-    helper = TimezoneHelper()
+    helper = get_timezone_helper()
 
     # Parse UTC timestamp
     utc_dt = datetime.fromisoformat(utc_timestamp.replace('Z', '+00:00'))
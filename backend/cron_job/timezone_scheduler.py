@@ -7,12 +7,22 @@ Handles different user timezones correctly for Render (UTC) deployment
 import asyncio
 import logging
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from cryptography.fernet import Fernet
+import httpx
 import pytz
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    # Optional C parser, several times faster than fromisoformat for bulk scans
+    import ciso8601
+except ImportError:
+    ciso8601 = None
 
 # Load environment variables
 load_dotenv()
@@ -24,6 +34,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def parse_utc_timestamp(value):
+    """Parse a scheduled_at value from the database into an aware datetime"""
+    # Supabase always returns plain str; anything else (possibly unhashable)
+    # is passed through untouched and never reaches the cache
+    if type(value) is not str:
+        return value
+    return _parse_utc_string(value)
+
+@lru_cache(maxsize=4096)
+def _parse_utc_string(value):
+    """
+    Parse an ISO 8601 string into an aware datetime
+
+    Scheduled posts are rescanned every minute until due, so parsed values
+    are cached; datetimes are immutable and safe to share. Values without
+    an offset are taken as UTC.
+    """
+    if ciso8601 is not None:
+        dt = ciso8601.parse_datetime(value)
+    else:
+        # Supabase returns ISO 8601; only the 'Z' suffix needs rewriting for fromisoformat
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def utc_now_iso():
+    """Current UTC time as an ISO 8601 string for status metadata"""
+    # stdlib timezone.utc skips pytz's zone object lookup; output is identical
+    return datetime.now(timezone.utc).isoformat()
+
+def create_batch_http_client(max_connections: int) -> httpx.AsyncClient:
+    """HTTP client shared by one publishing batch, with a pool sized to its concurrency"""
+    max_connections = max(max_connections, 1)
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+
 class TimezoneAwareScheduler:
     """Scheduler that handles multiple user timezones correctly - MVP Optimized for 100 Users × 5 Posts"""
 
@@ -43,6 +93,9 @@ class TimezoneAwareScheduler:
     # Post expiration settings - prevent old posts
     MAX_PUBLISH_DELAY_HOURS = 24  # Posts expire after 24 hours
 
+    # Profile timezones rarely change, so reuse them across scheduler runs
+    TIMEZONE_CACHE_TTL_SECONDS = 15 * 60
+
     def __init__(self):
         # Initialize Supabase
         supabase_url = os.getenv("SUPABASE_URL")
@@ -53,6 +106,9 @@ class TimezoneAwareScheduler:
 
         self.supabase: Client = create_client(supabase_url, supabase_key)
 
+        # user_id -> (timezone, monotonic expiry time)
+        self._timezone_cache = {}
+
         # Initialize encryption
         encryption_key = os.getenv("ENCRYPTION_KEY")
         self.cipher = None
@@ -61,22 +117,45 @@ class TimezoneAwareScheduler:
                 self.cipher = Fernet(encryption_key.encode())
                 logger.info("Encryption initialized")
             except Exception as e:
-                logger.warning(f"Failed to initialize encryption: {e}")
+                logger.warning("Failed to initialize encryption: %s", e)
 
     def get_user_timezone(self, user_id: str) -> str:
         """Get user's timezone from database, default to UTC if not found"""
-        try:
-            # Query user profile for timezone
-            response = self.supabase.table("profiles").select("timezone").eq("id", user_id).execute()
-
-            if response.data and len(response.data) > 0:
-                user_timezone = response.data[0].get("timezone", "UTC")
-                return user_timezone if user_timezone else "UTC"
+        return self.get_user_timezones([user_id])[user_id]
+
+    def get_user_timezones(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        """Get timezones for several users with one profiles query, default to UTC if not found"""
+        now = time.monotonic()
+        timezones = {}
+        missing = []
+
+        for user_id in user_ids:
+            cached = self._timezone_cache.get(user_id)
+            if cached and cached[1] > now:
+                timezones[user_id] = cached[0]
             else:
-                return "UTC"
+                missing.append(user_id)
+
+        if not missing:
+            return timezones
+
+        try:
+            # Query all uncached profiles at once
+            response = self.supabase.table("profiles").select("id,timezone").in_("id", missing).execute()
+            fetched = {row["id"]: row.get("timezone") or "UTC" for row in response.data or []}
         except Exception as e:
-            logger.warning(f"Could not get timezone for user {user_id}: {e}")
-            return "UTC"
+            logger.warning("Could not get timezones for %s users: %s", len(missing), e)
+            # Fall back to UTC without caching so the next run retries
+            timezones.update(dict.fromkeys(missing, "UTC"))
+            return timezones
+
+        expires_at = now + self.TIMEZONE_CACHE_TTL_SECONDS
+        for user_id in missing:
+            user_timezone = fetched.get(user_id, "UTC")
+            timezones[user_id] = user_timezone
+            self._timezone_cache[user_id] = (user_timezone, expires_at)
+
+        return timezones
 
     def get_current_time_in_user_timezone(self, user_timezone: str) -> datetime:
         """Get current time in user's timezone"""
@@ -86,7 +165,7 @@ class TimezoneAwareScheduler:
             now_user_time = now_utc.astimezone(user_tz)
             return now_user_time
         except Exception as e:
-            logger.warning(f"Invalid timezone {user_timezone}, using UTC: {e}")
+            logger.warning("Invalid timezone %s, using UTC: %s", user_timezone, e)
             return datetime.now(pytz.UTC)
 
     def convert_user_time_to_utc(self, user_time: datetime, user_timezone: str) -> datetime:
@@ -100,7 +179,7 @@ class TimezoneAwareScheduler:
             utc_time = user_time.astimezone(pytz.UTC)
             return utc_time
         except Exception as e:
-            logger.warning(f"Error converting time for timezone {user_timezone}: {e}")
+            logger.warning("Error converting time for timezone %s: %s", user_timezone, e)
             return user_time  # Return as-is if conversion fails
 
     def validate_mvp_requirements(self, due_posts):
@@ -109,35 +188,29 @@ class TimezoneAwareScheduler:
             return True
 
         # Count posts per user
-        user_post_counts = {}
-        total_users = 0
-
-        for post in due_posts:
-            user_id = post.get('user_id')
-            if user_id not in user_post_counts:
-                user_post_counts[user_id] = 0
-                total_users += 1
-            user_post_counts[user_id] += 1
+        user_post_counts = Counter(post.get('user_id') for post in due_posts)
+        total_users = len(user_post_counts)
 
         # Validate MVP limits
-        max_posts_per_user = max(user_post_counts.values()) if user_post_counts else 0
+        max_posts_per_user = max(user_post_counts.values())
         total_posts = len(due_posts)
 
         # Log MVP metrics
-        logger.info(f"🎯 MVP VALIDATION:")
-        logger.info(f"  👥 Users: {total_users}/{self.MVP_MAX_USERS}")
-        logger.info(f"  📄 Posts: {total_posts}/{self.MVP_TARGET_POSTS}")
-        logger.info(f"  📊 Max per user: {max_posts_per_user}/{self.MVP_MAX_POSTS_PER_USER}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎯 MVP VALIDATION:")
+            logger.info("  👥 Users: %s/%s", total_users, self.MVP_MAX_USERS)
+            logger.info("  📄 Posts: %s/%s", total_posts, self.MVP_TARGET_POSTS)
+            logger.info("  📊 Max per user: %s/%s", max_posts_per_user, self.MVP_MAX_POSTS_PER_USER)
 
         # Warnings for exceeding MVP limits
         if total_users > self.MVP_MAX_USERS:
-            logger.warning(f"⚠️ Exceeds MVP user limit: {total_users}/{self.MVP_MAX_USERS}")
+            logger.warning("⚠️ Exceeds MVP user limit: %s/%s", total_users, self.MVP_MAX_USERS)
 
         if max_posts_per_user > self.MVP_MAX_POSTS_PER_USER:
-            logger.warning(f"⚠️ Exceeds MVP posts per user: {max_posts_per_user}/{self.MVP_MAX_POSTS_PER_USER}")
+            logger.warning("⚠️ Exceeds MVP posts per user: %s/%s", max_posts_per_user, self.MVP_MAX_POSTS_PER_USER)
 
         if total_posts > self.MVP_TARGET_POSTS:
-            logger.warning(f"⚠️ Exceeds MVP total posts: {total_posts}/{self.MVP_TARGET_POSTS}")
+            logger.warning("⚠️ Exceeds MVP total posts: %s/%s", total_posts, self.MVP_TARGET_POSTS)
 
         return True  # Always proceed, just log warnings
 
@@ -152,27 +225,37 @@ class TimezoneAwareScheduler:
             ).eq("status", "scheduled").execute()
 
             scheduled_posts = response.data
-            logger.info(f"Found {len(scheduled_posts)} total scheduled content items")
+            logger.info("Found %s total scheduled content items", len(scheduled_posts))
 
             # Group by user to handle timezones efficiently
             posts_by_user = {}
             for post in scheduled_posts:
-                user_id = post['user_id']
-                if user_id not in posts_by_user:
-                    posts_by_user[user_id] = []
-                posts_by_user[user_id].append(post)
+                posts_by_user.setdefault(post['user_id'], []).append(post)
 
             # Check each user's posts against their local time
             due_posts = []
+            user_timezones = self.get_user_timezones(posts_by_user)
+
+            # Aware datetimes compare by instant, so due checks run in UTC and
+            # local times are only computed when they will actually be logged
+            now_utc = datetime.now(timezone.utc)
+            log_local_times = logger.isEnabledFor(logging.INFO)
 
             for user_id, user_posts in posts_by_user.items():
                 # Get user's timezone
-                user_timezone = self.get_user_timezone(user_id)
-                logger.info(f"User {user_id}: timezone = {user_timezone}")
+                user_timezone = user_timezones[user_id]
 
-                # Get current time in user's timezone
-                current_user_time = self.get_current_time_in_user_timezone(user_timezone)
-                logger.info(f"User {user_id}: current local time = {current_user_time}")
+                # Resolve the timezone once for all of this user's posts; it only
+                # affects the local-time log lines, the due check is in UTC
+                try:
+                    user_tz = pytz.timezone(user_timezone)
+                except pytz.UnknownTimeZoneError as e:
+                    logger.warning("Unknown timezone for user %s, logging local times in UTC: %s", user_id, e)
+                    user_tz = pytz.UTC
+
+                if log_local_times:
+                    logger.info("User %s: timezone = %s", user_id, user_timezone)
+                    logger.info("User %s: current local time = %s", user_id, now_utc.astimezone(user_tz))
 
                 # Check each post for this user
                 for post in user_posts:
@@ -181,30 +264,24 @@ class TimezoneAwareScheduler:
                     if scheduled_at_utc:
                         try:
                             # Parse the UTC timestamp from database
-                            if isinstance(scheduled_at_utc, str):
-                                # Handle ISO format strings
-                                if scheduled_at_utc.endswith('Z'):
-                                    scheduled_at_utc = scheduled_at_utc[:-1] + '+00:00'
-                                scheduled_utc_dt = datetime.fromisoformat(scheduled_at_utc.replace('Z', '+00:00'))
-                            else:
-                                scheduled_utc_dt = scheduled_at_utc
-
-                            # Convert to user's timezone for comparison
-                            scheduled_user_time = scheduled_utc_dt.astimezone(pytz.timezone(user_timezone))
+                            scheduled_utc_dt = parse_utc_timestamp(scheduled_at_utc)
+                            is_due = now_utc >= scheduled_utc_dt
 
-                            logger.info(f"Post {post['id']}: scheduled UTC = {scheduled_utc_dt}, local = {scheduled_user_time}")
-
-                            # Check if it's due (current time >= scheduled time)
-                            if current_user_time >= scheduled_user_time:
+                            if is_due:
                                 due_posts.append(post)
-                                logger.info(f"✅ Post {post['id']} is DUE for publishing (local time: {scheduled_user_time})")
-                            else:
-                                logger.info(f"⏰ Post {post['id']} not yet due (scheduled: {scheduled_user_time})")
+
+                            if log_local_times:
+                                scheduled_user_time = scheduled_utc_dt.astimezone(user_tz)
+                                logger.info("Post %s: scheduled UTC = %s, local = %s", post['id'], scheduled_utc_dt, scheduled_user_time)
+                                if is_due:
+                                    logger.info("✅ Post %s is DUE for publishing (local time: %s)", post['id'], scheduled_user_time)
+                                else:
+                                    logger.info("⏰ Post %s not yet due (scheduled: %s)", post['id'], scheduled_user_time)
 
                         except Exception as e:
-                            logger.error(f"Error parsing scheduled time for post {post['id']}: {e}")
+                            logger.error("Error parsing scheduled time for post %s: %s", post['id'], e)
 
-            logger.info(f"📋 Found {len(due_posts)} posts due for publishing across all timezones")
+            logger.info("📋 Found %s posts due for publishing across all timezones", len(due_posts))
 
             # Validate MVP requirements
             self.validate_mvp_requirements(due_posts)
@@ -216,22 +293,21 @@ class TimezoneAwareScheduler:
             return len(due_posts)
 
         except Exception as e:
-            logger.error(f"Error in timezone-aware scheduling: {e}")
+            logger.error("Error in timezone-aware scheduling: %s", e)
             return 0
 
     async def publish_due_posts_smart(self, due_posts):
         """MAXIMUM SPEED: Publish ALL posts concurrently - MVP Optimized"""
-        import time
         start_time = time.time()
 
-        logger.info(f"⚡ MAXIMUM SPEED MODE: Publishing {len(due_posts)} posts (MVP: 100 users × 5 posts)...")
+        logger.info("⚡ MAXIMUM SPEED MODE: Publishing %s posts (MVP: 100 users × 5 posts)...", len(due_posts))
 
         # First filter out expired posts
         valid_posts = await self.filter_expired_posts(due_posts)
 
         if len(valid_posts) < len(due_posts):
             expired_count = len(due_posts) - len(valid_posts)
-            logger.info(f"⏰ Filtered out {expired_count} expired posts")
+            logger.info("⏰ Filtered out %s expired posts", expired_count)
 
         if not valid_posts:
             logger.info("⏰ No valid posts to publish")
@@ -248,31 +324,33 @@ class TimezoneAwareScheduler:
         total_duration = time.time() - start_time
         await self.log_mvp_performance_metrics(published_count, len(valid_posts), total_duration)
 
-        logger.info(f"⚡ MAXIMUM SPEED COMPLETED: {published_count}/{len(valid_posts)} posts published in {total_duration:.1f}s")
+        logger.info("⚡ MAXIMUM SPEED COMPLETED: %s/%s posts published in %.1fs", published_count, len(valid_posts), total_duration)
         return published_count
 
     async def log_mvp_performance_metrics(self, published_count, total_posts, duration):
         """Log MVP-specific performance metrics for 100 users × 5 posts"""
         success_rate = (published_count / total_posts * 100) if total_posts > 0 else 0
 
-        logger.info(f"🎯 MVP PERFORMANCE METRICS:")
-        logger.info(f"  👥 Target Users: {self.MVP_MAX_USERS}")
-        logger.info(f"  📄 Target Posts: {self.MVP_TARGET_POSTS}")
-        logger.info(f"  📊 Actual Posts: {total_posts}")
-        if published_count > 0:
-            logger.info(f"  ⚡ Publishing Time: {duration:.1f} seconds")
-            logger.info(f"  ✅ Success Rate: {success_rate:.1f}%")
-            logger.info(f"  🎯 Posts/Minute: {(published_count / max(duration, 1) * 60):.1f}")
+        # One level check for the whole metrics block instead of one per line
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎯 MVP PERFORMANCE METRICS:")
+            logger.info("  👥 Target Users: %s", self.MVP_MAX_USERS)
+            logger.info("  📄 Target Posts: %s", self.MVP_TARGET_POSTS)
+            logger.info("  📊 Actual Posts: %s", total_posts)
+            if published_count > 0:
+                logger.info("  ⚡ Publishing Time: %.1f seconds", duration)
+                logger.info("  ✅ Success Rate: %.1f%%", success_rate)
+                logger.info("  🎯 Posts/Minute: %.1f", published_count / max(duration, 1) * 60)
 
         # MVP Target validation
         if published_count > 0 and duration > 120:  # 2 minutes
-            logger.warning(f"⚠️ Publishing slower than MVP target: {duration:.1f}s > 120s")
+            logger.warning("⚠️ Publishing slower than MVP target: %.1fs > 120s", duration)
 
         if published_count > 0 and success_rate < 95:
-            logger.warning(f"⚠️ Success rate below MVP target: {success_rate:.1f}% < 95%")
+            logger.warning("⚠️ Success rate below MVP target: %.1f%% < 95%%", success_rate)
 
         if total_posts > self.MVP_TARGET_POSTS:
-            logger.info(f"📈 Exceeding MVP capacity: {total_posts}/{self.MVP_TARGET_POSTS} posts")
+            logger.info("📈 Exceeding MVP capacity: %s/%s posts", total_posts, self.MVP_TARGET_POSTS)
 
         # Success indicators
         if published_count == 0:
@@ -283,7 +361,12 @@ class TimezoneAwareScheduler:
             logger.info("📊 Performance within acceptable MVP range 📈")
 
     async def filter_expired_posts(self, posts):
-        """Remove posts that are too old to publish (expired after 24 hours)"""
+        """
+        Remove posts that are too old to publish (expired after 24 hours)
+
+        scheduled_at values were already parsed while finding due posts, so
+        parse_utc_timestamp answers these from its cache.
+        """
         valid_posts = []
         now_utc = datetime.now(pytz.UTC)
 
@@ -292,12 +375,7 @@ class TimezoneAwareScheduler:
                 # Calculate time since post was scheduled
                 scheduled_at = post.get('scheduled_at', '')
                 if scheduled_at:
-                    if isinstance(scheduled_at, str):
-                        if scheduled_at.endswith('Z'):
-                            scheduled_at = scheduled_at[:-1] + '+00:00'
-                        scheduled_utc = datetime.fromisoformat(scheduled_at.replace('Z', '+00:00'))
-                    else:
-                        scheduled_utc = scheduled_at
+                    scheduled_utc = parse_utc_timestamp(scheduled_at)
 
                     time_diff = now_utc - scheduled_utc
                     hours_diff = time_diff.total_seconds() / 3600
@@ -305,34 +383,37 @@ class TimezoneAwareScheduler:
                     if hours_diff > self.MAX_PUBLISH_DELAY_HOURS:
                         # Mark post as expired
                         await self.mark_post_expired(post)
-                        logger.warning(f"⏰ Post {post['id']} EXPIRED ({hours_diff:.1f}h old)")
+                        logger.warning("⏰ Post %s EXPIRED (%.1fh old)", post['id'], hours_diff)
                         continue
 
                 valid_posts.append(post)
 
             except Exception as e:
-                logger.error(f"Error checking expiration for post {post.get('id', 'unknown')}: {e}")
+                logger.error("Error checking expiration for post %s: %s", post.get('id', 'unknown'), e)
                 # If we can't check expiration, include the post
                 valid_posts.append(post)
 
         return valid_posts
 
+    def update_post_status(self, post, status, **metadata):
+        """Set a post's status, merging metadata into its existing god_mode_metadata"""
+        self.supabase.table("created_content").update({
+            "status": status,
+            "god_mode_metadata": {**(post.get('god_mode_metadata') or {}), **metadata}
+        }).eq("id", post['id']).execute()
+
     async def mark_post_expired(self, post):
         """Mark a post as expired in the database"""
         try:
-            post_id = post['id']
-            self.supabase.table("created_content").update({
-                "status": "expired",
-                "god_mode_metadata": {
-                    **(post.get('god_mode_metadata') or {}),
-                    "expired_at": datetime.now(pytz.UTC).isoformat(),
-                    "expired_reason": f"Publishing window exceeded ({self.MAX_PUBLISH_DELAY_HOURS}h limit)",
-                    "scheduled_time": post.get('scheduled_at')
-                }
-            }).eq("id", post_id).execute()
+            self.update_post_status(
+                post, "expired",
+                expired_at=utc_now_iso(),
+                expired_reason=f"Publishing window exceeded ({self.MAX_PUBLISH_DELAY_HOURS}h limit)",
+                scheduled_time=post.get('scheduled_at')
+            )
 
         except Exception as e:
-            logger.error(f"Failed to mark post {post.get('id', 'unknown')} as expired: {e}")
+            logger.error("Failed to mark post %s as expired: %s", post.get('id', 'unknown'), e)
 
     async def publish_concurrent_by_platform(self, posts):
         """Publish posts concurrently but limited by platform"""
@@ -344,107 +425,113 @@ class TimezoneAwareScheduler:
 
         # Create concurrent tasks for each platform
         all_tasks = []
-        for platform, platform_posts in platform_groups.items():
-            max_concurrent = self.PLATFORM_CONCURRENT_LIMITS.get(platform, 2)
-            semaphore = asyncio.Semaphore(max_concurrent)
+        from cron_job.content_publisher import ContentPublisherService
 
-            logger.info(f"📊 Platform {platform}: {len(platform_posts)} posts, max concurrent: {max_concurrent}")
+        # At most one request per post is in flight, and each platform's semaphore
+        # caps its posts, so size the shared pool to the sum of those caps
+        max_connections = sum(
+            min(self.PLATFORM_CONCURRENT_LIMITS.get(platform, 2), len(platform_posts))
+            for platform, platform_posts in platform_groups.items()
+        )
 
-            for post in platform_posts:
-                task = self.publish_single_with_semaphore(post, semaphore)
-                all_tasks.append(task)
+        # One HTTP client and publisher for the whole batch so connections are reused
+        async with create_batch_http_client(max_connections) as http_client:
+            publisher = ContentPublisherService(self.supabase, self.cipher, http_client)
+            for platform, platform_posts in platform_groups.items():
+                max_concurrent = self.PLATFORM_CONCURRENT_LIMITS.get(platform, 2)
+                semaphore = asyncio.Semaphore(max_concurrent)
 
-        # Execute all posts concurrently (limited per platform)
-        results = await asyncio.gather(*all_tasks, return_exceptions=True)
+                logger.info("📊 Platform %s: %s posts, max concurrent: %s", platform, len(platform_posts), max_concurrent)
 
-        # Count successful publications
-        successful = sum(1 for r in results if not isinstance(r, Exception))
+                for post in platform_posts:
+                    task = self.publish_single_with_semaphore(post, semaphore, publisher)
+                    all_tasks.append(task)
+
+            # Execute all posts concurrently (limited per platform)
+            results = await asyncio.gather(*all_tasks, return_exceptions=True)
+
+        # Count successful publications (failures come back as False or an exception)
+        successful = sum(1 for r in results if r is True)
         failed = len(results) - successful
 
         if failed > 0:
-            logger.warning(f"⚠️ {failed} posts failed during concurrent publishing")
+            logger.warning("⚠️ %s posts failed during concurrent publishing", failed)
 
         return successful
 
     async def publish_maximum_speed(self, posts):
         """MAXIMUM SPEED: Publish ALL posts concurrently (no limits)"""
-        logger.info(f"⚡ MAXIMUM SPEED MODE: Publishing {len(posts)} posts concurrently with NO limits")
+        logger.info("⚡ MAXIMUM SPEED MODE: Publishing %s posts concurrently with NO limits", len(posts))
 
-        # Create ALL tasks simultaneously (no platform limits, no semaphores)
-        tasks = []
-        for post in posts:
-            task = self.publish_single_post_max_speed(post)
-            tasks.append(task)
+        from cron_job.content_publisher import ContentPublisherService
+
+        # One HTTP client and publisher for the whole batch so connections are reused;
+        # every post runs at once, so the pool gets one connection per post
+        async with create_batch_http_client(len(posts)) as http_client:
+            publisher = ContentPublisherService(self.supabase, self.cipher, http_client)
+            # Create ALL tasks simultaneously (no platform limits, no semaphores)
+            tasks = []
+            for post in posts:
+                task = self.publish_single_post_max_speed(post, publisher)
+                tasks.append(task)
 
-        # Execute ALL posts at the same time
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Execute ALL posts at the same time
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Count results
-        successful = sum(1 for r in results if not isinstance(r, Exception))
+        # Count results (failures come back as False or an exception)
+        successful = sum(1 for r in results if r is True)
         failed = len(results) - successful
 
-        logger.info(f"⚡ MAXIMUM SPEED RESULTS: {successful}/{len(posts)} posts published, {failed} failed")
+        logger.info("⚡ MAXIMUM SPEED RESULTS: %s/%s posts published, %s failed", successful, len(posts), failed)
 
         if failed > 0:
-            logger.warning(f"⚠️ {failed} posts failed - possible rate limiting")
+            logger.warning("⚠️ %s posts failed - possible rate limiting", failed)
 
         return successful
 
-    async def publish_single_post_max_speed(self, post):
+    async def publish_single_post_max_speed(self, post, publisher):
         """Publish single post without any concurrency limits"""
         try:
-            from cron_job.content_publisher import ContentPublisherService
-            publisher = ContentPublisherService(self.supabase, self.cipher)
-            success = await publisher.publish_created_content(post)
+            success = await publisher.publish_created_content(post, update_status=False)
 
             if success:
                 # Update status to published
-                post_id = post['id']
-                self.supabase.table("created_content").update({
-                    "status": "published",
-                    "god_mode_metadata": {
-                        **(post.get('god_mode_metadata') or {}),
-                        "published_at": datetime.now(pytz.UTC).isoformat(),
-                        "published_by_cron": True,
-                        "platform_published": True,
-                        "max_speed_mode": True
-                    }
-                }).eq("id", post_id).execute()
+                self.update_post_status(
+                    post, "published",
+                    published_at=utc_now_iso(),
+                    published_by_cron=True,
+                    platform_published=True,
+                    max_speed_mode=True
+                )
                 return True
             else:
                 # Mark as failed
-                post_id = post['id']
-                self.supabase.table("created_content").update({
-                    "status": "draft",
-                    "god_mode_metadata": {
-                        **(post.get('god_mode_metadata') or {}),
-                        "publish_error": "Platform publishing failed",
-                        "publish_failed_at": datetime.now(pytz.UTC).isoformat(),
-                        "max_speed_mode": True
-                    }
-                }).eq("id", post_id).execute()
+                self.update_post_status(
+                    post, "draft",
+                    publish_error="Platform publishing failed",
+                    publish_failed_at=utc_now_iso(),
+                    max_speed_mode=True
+                )
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Exception in max speed mode for post {post.get('id', 'unknown')}: {e}")
+            logger.error("❌ Exception in max speed mode for post %s: %s", post.get('id', 'unknown'), e)
             return False
 
-    async def publish_single_with_semaphore(self, post, semaphore):
+    async def publish_single_with_semaphore(self, post, semaphore, publisher):
         """Publish a single post with concurrency control"""
         async with semaphore:
             try:
-                from cron_job.content_publisher import ContentPublisherService
-                publisher = ContentPublisherService(self.supabase, self.cipher)
                 return await publisher.publish_created_content(post)
             except Exception as e:
-                logger.error(f"❌ Exception publishing post {post.get('id', 'unknown')}: {e}")
+                logger.error("❌ Exception publishing post %s: %s", post.get('id', 'unknown'), e)
                 return False
 
     async def publish_due_posts(self, due_posts):
         """Publish posts that are due using actual platform APIs"""
         from content_publisher import ContentPublisherService
 
-        logger.info(f"🚀 Publishing {len(due_posts)} due posts to platforms...")
+        logger.info("🚀 Publishing %s due posts to platforms...", len(due_posts))
 
         # Initialize content publisher service
         publisher_service = ContentPublisherService(self.supabase, self.cipher)
@@ -454,50 +541,41 @@ class TimezoneAwareScheduler:
                 post_id = post['id']
                 platform = post['platform']
 
-                logger.info(f"Publishing post {post_id} to {platform} platform")
+                logger.info("Publishing post %s to %s platform", post_id, platform)
 
                 # Actually publish to the platform using ContentPublisherService
-                success = await publisher_service.publish_created_content(post)
+                success = await publisher_service.publish_created_content(post, update_status=False)
 
                 if success:
                     # Update status to published
-                    self.supabase.table("created_content").update({
-                        "status": "published",
-                        "god_mode_metadata": {
-                            **(post.get('god_mode_metadata') or {}),
-                            "published_at": datetime.now(pytz.UTC).isoformat(),
-                            "published_by_cron": True,
-                            "platform_published": True
-                        }
-                    }).eq("id", post_id).execute()
-
-                    logger.info(f"✅ Successfully published post {post_id} to {platform}")
+                    self.update_post_status(
+                        post, "published",
+                        published_at=utc_now_iso(),
+                        published_by_cron=True,
+                        platform_published=True
+                    )
+
+                    logger.info("✅ Successfully published post %s to %s", post_id, platform)
 
                 else:
                     # Mark as failed if publishing didn't succeed
-                    self.supabase.table("created_content").update({
-                        "status": "draft",
-                        "god_mode_metadata": {
-                            **(post.get('god_mode_metadata') or {}),
-                            "publish_error": "Platform publishing failed",
-                            "publish_failed_at": datetime.now(pytz.UTC).isoformat()
-                        }
-                    }).eq("id", post_id).execute()
+                    self.update_post_status(
+                        post, "draft",
+                        publish_error="Platform publishing failed",
+                        publish_failed_at=utc_now_iso()
+                    )
 
-                    logger.error(f"❌ Failed to publish post {post_id} to {platform}")
+                    logger.error("❌ Failed to publish post %s to %s", post_id, platform)
 
             except Exception as e:
-                logger.error(f"❌ Exception while publishing post {post['id']}: {e}")
+                logger.error("❌ Exception while publishing post %s: %s", post['id'], e)
 
                 # Mark as failed
-                self.supabase.table("created_content").update({
-                    "status": "draft",
-                    "god_mode_metadata": {
-                        **(post.get('god_mode_metadata') or {}),
-                        "publish_error": str(e),
-                        "publish_failed_at": datetime.now(pytz.UTC).isoformat()
-                    }
-                }).eq("id", post['id']).execute()
+                self.update_post_status(
+                    post, "draft",
+                    publish_error=str(e),
+                    publish_failed_at=utc_now_iso()
+                )
 
 async def run_timezone_aware_cron():
     """Run the timezone-aware cron job"""
@@ -10,6 +10,7 @@ import sys
 import logging
 import time
 import argparse
+from datetime import datetime
 
 # Configure logging for Render
 logging.basicConfig(
@@ -56,7 +57,7 @@ async def run_continuous_test(duration_minutes=5):
 
     while time.time() < end_time:
         run_count += 1
-        print(f'\n=== Run #{run_count} at {__import__("datetime").datetime.now()} ===')
+        print(f'\n=== Run #{run_count} at {datetime.now()} ===')
 
         await run_mvp_cron()
 
@@ -84,8 +85,8 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.test:
-        print(f"Starting continuous test mode for {args.duration} minutes - {__import__('datetime').datetime.now()}")
+        print(f"Starting continuous test mode for {args.duration} minutes - {datetime.now()}")
         asyncio.run(run_continuous_test(args.duration))
     else:
-        print(f"Starting single MVP cron job - {__import__('datetime').datetime.now()}")
+        print(f"Starting single MVP cron job - {datetime.now()}")
         asyncio.run(run_mvp_cron())
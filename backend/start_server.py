@@ -9,28 +9,33 @@ import os
 
 app = Flask(__name__)
 
+# Endpoint payloads are static, so build them once at import
+HEALTH_PAYLOAD = {
+    'status': 'healthy',
+    'service': 'Emily Social Publisher MVP',
+    'mvp_specs': '100 users × 5 posts',
+    'capacity': '500 posts',
+    'concurrent': '21 posts simultaneous',
+    'platforms': ['Facebook', 'Instagram', 'LinkedIn', 'YouTube'],
+    'version': '1.0.0'
+}
+
+STATUS_PAYLOAD = {
+    'service': 'Emily Social Publisher MVP',
+    'status': 'running',
+    'uptime': 'active',
+    'mvp_ready': True
+}
+
 @app.route('/')
 def health():
     """Health check endpoint for Render"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Emily Social Publisher MVP',
-        'mvp_specs': '100 users × 5 posts',
-        'capacity': '500 posts',
-        'concurrent': '21 posts simultaneous',
-        'platforms': ['Facebook', 'Instagram', 'LinkedIn', 'YouTube'],
-        'version': '1.0.0'
-    })
+    return jsonify(HEALTH_PAYLOAD)
 
 @app.route('/status')
 def status():
     """Detailed status endpoint"""
-    return jsonify({
-        'service': 'Emily Social Publisher MVP',
-        'status': 'running',
-        'uptime': 'active',
-        'mvp_ready': True
-    })
+    return jsonify(STATUS_PAYLOAD)
 
 if __name__ == '__main__':
     print('🚀 Emily Social Publisher MVP - Starting...')